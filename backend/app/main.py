@@ -4,12 +4,14 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from backend.app.database import Base, engine
 import backend.app.models as models
-from backend.app.routes import auth, workouts
+from backend.app.routes import auth, workouts, onboarding, nutrition
 
 app = FastAPI()
 
 app.include_router(auth.router)
 app.include_router(workouts.router)
+app.include_router(onboarding.router)
+app.include_router(nutrition.router)
 
 @app.get("/")
 def root():
@@ -1,7 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
 from jose import jwt, JWTError
 from datetime import datetime, timedelta, timezone
 import os
@@ -11,6 +10,8 @@ from typing import Annotated
 
 from backend.app.database import get_db
 from backend.app.models import User, UserProfile, Equipment, Injury
+from backend.app.services.catalog_snapshot import load_snapshot
+from backend.app.services.auth_service import pwd_hash, hash_password, find_bodyweight
 from backend.app.schemas import OnboardingCreate, UserProfileRead, EquipmentRead, InjuryRead, Token, UpdateEquipment, UpdateInjuries, UserProfileUpdate
 
 
@@ -26,8 +27,6 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/sign-in")
 
-pwd_hash = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 db_dependency = Annotated[Session, Depends(get_db)]
 form_dependency = Annotated[OAuth2PasswordRequestForm, Depends()]
 token_dependency = Annotated[str, Depends(oauth2_scheme)]
@@ -71,7 +70,7 @@ def decode_token(token: str):
         return None
 
 def get_bodyweight_id(db: Session):
-    item = db.query(Equipment).filter(Equipment.name.ilike("bodyweight")).first()
+    item = find_bodyweight(db)
     if not item:
         raise HTTPException(status_code=500, detail="Bodyweight missing from equipment table")
     return item
@@ -79,11 +78,17 @@ def get_bodyweight_id(db: Session):
 
 @router.get("/equipment", response_model=list[EquipmentRead])
 def list_equipment(db: db_dependency):
+    catalog = load_snapshot(db)
+    if catalog:
+        return catalog.equipment()
     return db.query(Equipment).all()
 
 
 @router.get("/injuries", response_model=list[InjuryRead])
 def list_injuries(db: db_dependency):
+    catalog = load_snapshot(db)
+    if catalog:
+        return catalog.injuries()
     return db.query(Injury).all()
 
 
@@ -101,7 +106,7 @@ def signup(payload: OnboardingCreate, db: db_dependency):
     if db.query(User).filter(User.email == payload.user.email).first():
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    hashed_password = pwd_hash.hash(payload.user.password)
+    hashed_password = hash_password(payload.user.password)
     user = User(email=payload.user.email, password=hashed_password)
     db.add(user)
     db.commit()
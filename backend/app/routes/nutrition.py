@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends, HTTPException
+from backend.app.routes.auth import get_current_user, db_dependency
+from backend.app.services.nutrition_service import compute_targets
+from backend.app.schemas import NutritionTargets
+from backend.app.models import UserProfile
+
+router = APIRouter(prefix="/nutrition", tags=["nutrition"])
+
+
+@router.get("/targets", response_model=NutritionTargets)
+def get_targets(db: db_dependency, current_user = Depends(get_current_user)):
+    profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return compute_targets(profile)
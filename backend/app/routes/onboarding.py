@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, UploadFile
+import hmac
+import io
+import os
+from typing import Literal
+
+from backend.app.routes.auth import db_dependency
+from backend.app.services.onboarding_service import read_records, import_members, CHUNK_SIZE
+from backend.app.schemas import BulkOnboardingReport
+
+ONBOARDING_API_KEY = os.getenv("ONBOARDING_API_KEY")
+
+router = APIRouter(prefix="/onboarding", tags=["onboarding"])
+
+
+def verify_api_key(x_api_key: str = Header(...)):
+    if not ONBOARDING_API_KEY or not hmac.compare_digest(x_api_key.encode("utf-8"), ONBOARDING_API_KEY.encode("utf-8")):
+        raise HTTPException(status_code=403, detail="Invalid API key")
+
+
+@router.post("/bulk", response_model=BulkOnboardingReport, dependencies=[Depends(verify_api_key)])
+def bulk_onboarding(db: db_dependency, file: UploadFile = File(...), format: Literal["csv", "ndjson"] | None = None, start_row: int = Query(1, ge=1), chunk_size: int = Query(CHUNK_SIZE, ge=1)):
+    fmt = format or ("ndjson" if (file.filename or "").endswith((".ndjson", ".jsonl")) else "csv")
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        return import_members(db, read_records(stream, fmt), chunk_size=chunk_size, start_row=start_row)
+    except LookupError as e:
+        raise HTTPException(status_code=500, detail=str(e))
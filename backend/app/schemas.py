@@ -91,6 +91,19 @@ class OnboardingCreate(BaseModel):
     profile: UserProfileCreate
 
 
+class BulkOnboardingError(BaseModel):
+    row: int
+    email: str | None = None
+    detail: str
+
+class BulkOnboardingReport(BaseModel):
+    created: int
+    skipped: int
+    failed: int
+    next_row: int
+    errors: list[BulkOnboardingError] = []
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str
@@ -158,6 +171,15 @@ class WorkoutRead(WorkoutBase):
     class Config:
         from_attributes=True
 
+class NutritionTargets(BaseModel):
+    bmr: int
+    tdee: int
+    calories: int
+    protein_g: int
+    carbs_g: int
+    fat_g: int
+
+
 # Will come back to the log stuff later to add calories macros portion ingredients health score
 class LogBase(BaseModel):
     type: LogType
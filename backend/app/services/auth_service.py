@@ -0,0 +1,14 @@
+from passlib.context import CryptContext
+from sqlalchemy.orm import Session
+
+from backend.app.models import Equipment
+
+pwd_hash = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def hash_password(password: str):
+    return pwd_hash.hash(password)
+
+
+def find_bodyweight(db: Session):
+    return db.query(Equipment).filter(Equipment.name.ilike("bodyweight")).first()
@@ -0,0 +1,172 @@
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from backend.app.models import Equipment, Exercise, Injury
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+snapshot_path = BASE_DIR / "data" / "catalog.snapshot"
+
+MAGIC = b"FITCAT02"
+HEADER_SIZE = struct.Struct("<I")
+ALIGNMENT = 8
+
+
+class CatalogItem(NamedTuple):
+    id: int
+    name: str
+
+
+class CatalogExercise(NamedTuple):
+    id: int
+    name: str
+    target_muscle: str
+    equipment: CatalogItem | None
+
+
+def _pad(size: int):
+    return -size % ALIGNMENT
+
+
+def catalog_fingerprint(db: Session):
+    # Row count and max id per table, a snapshot whose fingerprint differs was written from other data
+    columns = []
+    for model in (Exercise, Equipment, Injury):
+        columns.append(select(func.count(model.id)).scalar_subquery())
+        columns.append(select(func.coalesce(func.max(model.id), 0)).scalar_subquery())
+    return [int(value) for value in db.execute(select(*columns)).one()]
+
+
+def write_snapshot(db: Session, path: Path = snapshot_path):
+    strings = {}
+
+    def intern(value: str):
+        return strings.setdefault(value, len(strings))
+
+    equipment = db.query(Equipment.id, Equipment.name).order_by(Equipment.id).all()
+    injuries = db.query(Injury.id, Injury.name).order_by(Injury.id).all()
+    exercises = db.query(Exercise.id, Exercise.name, Exercise.target_muscle, Exercise.equipment_id).order_by(Exercise.id).all()
+
+    equipment_rows = {item.id: row for row, item in enumerate(equipment)}
+    muscles = {}
+    for e in exercises:
+        muscles.setdefault(e.target_muscle, len(muscles))
+
+    arrays = {
+        "equipment_ids": np.array([item.id for item in equipment], dtype=np.int32),
+        "equipment_names": np.array([intern(item.name) for item in equipment], dtype=np.int32),
+        "injury_ids": np.array([item.id for item in injuries], dtype=np.int32),
+        "injury_names": np.array([intern(item.name) for item in injuries], dtype=np.int32),
+        "muscle_names": np.array([intern(name) for name in muscles], dtype=np.int32),
+        "exercise_ids": np.array([e.id for e in exercises], dtype=np.int32),
+        "exercise_names": np.array([intern(e.name) for e in exercises], dtype=np.int32),
+        "exercise_muscles": np.array([muscles[e.target_muscle] for e in exercises], dtype=np.int16),
+        "exercise_equipment": np.array([equipment_rows.get(e.equipment_id, -1) for e in exercises], dtype=np.int32),
+    }
+
+    encoded = [value.encode("utf-8") for value in strings]
+    arrays["string_offsets"] = np.cumsum([0] + [len(value) for value in encoded], dtype=np.int64)
+    arrays["strings"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+    # Array offsets are relative to the end of the header so they can be laid out before it is serialised
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        layout[name] = [array.dtype.str, list(array.shape), offset]
+        offset += array.nbytes + _pad(array.nbytes)
+    header = json.dumps({"fingerprint": catalog_fingerprint(db), "arrays": layout}).encode("utf-8")
+    header += b" " * _pad(len(MAGIC) + HEADER_SIZE.size + len(header))
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as file:
+        file.write(MAGIC + HEADER_SIZE.pack(len(header)) + header)
+        for array in arrays.values():
+            file.write(array.tobytes())
+            file.write(b"\0" * _pad(array.nbytes))
+    # Readers keep their existing mapping of the old inode until they notice the swap
+    os.replace(tmp_path, path)
+
+
+class CatalogSnapshot:
+    def __init__(self, path: Path):
+        with open(path, "rb") as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a catalog snapshot")
+        (header_length,) = HEADER_SIZE.unpack_from(self._buffer, len(MAGIC))
+        start = len(MAGIC) + HEADER_SIZE.size
+        header = json.loads(self._buffer[start:start + header_length])
+        base = start + header_length
+
+        self.fingerprint = header["fingerprint"]
+        self.arrays = {}
+        for name, (dtype, shape, offset) in header["arrays"].items():
+            dtype = np.dtype(dtype)
+            count = int(np.prod(shape))
+            self.arrays[name] = np.frombuffer(self._buffer, dtype=dtype, count=count, offset=base + offset).reshape(shape)
+
+        # Decoded once per mapping, a reseed produces a new file and therefore a new CatalogSnapshot
+        self._equipment = self._decode_equipment()
+        self._injuries = self._decode_injuries()
+        self._exercises = self._decode_exercises()
+
+    def string(self, index: int):
+        offsets = self.arrays["string_offsets"]
+        return self.arrays["strings"][offsets[index]:offsets[index + 1]].tobytes().decode("utf-8")
+
+    def equipment(self):
+        return self._equipment
+
+    def injuries(self):
+        return self._injuries
+
+    def exercises(self):
+        return self._exercises
+
+    def _decode_equipment(self):
+        a = self.arrays
+        return tuple(CatalogItem(int(i), self.string(n)) for i, n in zip(a["equipment_ids"], a["equipment_names"]))
+
+    def _decode_injuries(self):
+        a = self.arrays
+        return tuple(CatalogItem(int(i), self.string(n)) for i, n in zip(a["injury_ids"], a["injury_names"]))
+
+    def _decode_exercises(self):
+        a = self.arrays
+        equipment = self._equipment
+        muscles = [self.string(n) for n in a["muscle_names"]]
+        return tuple(
+            CatalogExercise(int(i), self.string(n), muscles[m], equipment[q] if q >= 0 else None)
+            for i, n, m, q in zip(a["exercise_ids"], a["exercise_names"], a["exercise_muscles"], a["exercise_equipment"])
+        )
+
+
+_cached_snapshot = None
+_cached_key = None
+
+
+def load_snapshot(db: Session, path: Path = snapshot_path):
+    global _cached_snapshot, _cached_key
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    key = (stat.st_ino, stat.st_mtime_ns)
+    if _cached_snapshot is None or key != _cached_key:
+        try:
+            _cached_snapshot = CatalogSnapshot(path)
+        except ValueError:
+            # Written by an older format, ignore it until the next reseed
+            return None
+        _cached_key = key
+    # A snapshot left over from another database (or edits made outside the seed scripts) falls back to the db
+    if _cached_snapshot.fingerprint != catalog_fingerprint(db):
+        return None
+    return _cached_snapshot
@@ -0,0 +1,198 @@
+import os
+import re
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+index_path = BASE_DIR / "data" / "exercise_index.npz"
+
+NGRAM_SIZE = 3
+SIMILARITY_THRESHOLD = 0.8
+
+non_alphanumeric = re.compile(r"[^a-z0-9]+")
+
+# Tokens that change the movement itself, names differing in any of these are never merged
+MOVEMENT_TOKENS = frozenset({
+    "incline", "decline", "flat", "up", "down", "wide", "close", "narrow", "neutral", "reverse",
+    "pronated", "supinated", "lying", "kneeling", "standing", "seated", "front", "lateral", "side",
+    "rear", "overhead", "internal", "external", "oblique", "smith", "hammer", "preacher", "sumo",
+    "goblet", "hack", "fly", "flye", "flyes", "flys", "press", "raise", "curl", "row", "extension",
+    "crossover", "pushdown", "squat", "deadlift", "lunge",
+})
+
+
+# Spellings of the same thing, applied after hyphens and spaces are normalised
+PHRASE_ALIASES = [
+    (re.compile(r"\bpull down\b"), "pulldown"),
+    (re.compile(r"\bpush down\b"), "pushdown"),
+    (re.compile(r"\bpush ups?\b"), "pushup"),
+    (re.compile(r"\bpull ups?\b"), "pullup"),
+    (re.compile(r"\bchin ups?\b"), "chinup"),
+    (re.compile(r"\bsit ups?\b"), "situp"),
+    (re.compile(r"\bcross over\b"), "crossover"),
+]
+TOKEN_ALIASES = {
+    "alternating": "alternate",
+    "biceps": "bicep",
+    "triceps": "tricep",
+    "flyes": "fly",
+    "flye": "fly",
+    "flys": "fly",
+    "curls": "curl",
+    "rows": "row",
+    "raises": "raise",
+    "presses": "press",
+    "lunges": "lunge",
+    "squats": "squat",
+    "extensions": "extension",
+}
+
+# Filler words, plus body parts that are already implied by the (muscle, equipment) block
+FILLER_TOKENS = frozenset({
+    "with", "on", "the", "a", "an", "of", "to", "over", "in", "for",
+    "shoulder", "bicep", "tricep", "chest",
+})
+
+
+def normalise_name(name: str):
+    return " ".join(non_alphanumeric.sub(" ", name.lower()).split())
+
+
+def canonical_tokens(name: str):
+    text = normalise_name(name)
+    for pattern, replacement in PHRASE_ALIASES:
+        text = pattern.sub(replacement, text)
+    return [TOKEN_ALIASES.get(t, t) for t in text.split() if TOKEN_ALIASES.get(t, t) not in FILLER_TOKENS]
+
+
+def char_ngrams(text: str, n: int = NGRAM_SIZE):
+    padded = f" {text} "
+    return [padded[i:i + n] for i in range(len(padded) - n + 1)]
+
+
+def build_ngram_matrix(names: list[str]):
+    # CSR layout (indptr, indices, data) with L2 normalised rows, so a row dot product is the cosine similarity
+    indptr = [0]
+    grams = []
+    counts = []
+    for name in names:
+        row = Counter(char_ngrams(name))
+        grams.extend(row.keys())
+        counts.extend(row.values())
+        indptr.append(len(grams))
+    _, indices = np.unique(np.array(grams), return_inverse=True)
+
+    indptr = np.array(indptr, dtype=np.int64)
+    data = np.array(counts, dtype=np.float32)
+    lengths = np.diff(indptr)
+    norms = np.sqrt(np.add.reduceat(data ** 2, indptr[:-1][lengths > 0]))
+    data /= np.repeat(norms, lengths[lengths > 0])
+    return indptr, indices.astype(np.int32), data
+
+
+def _block_similarity(rows: np.ndarray, indptr, indices, data):
+    starts, ends = indptr[rows], indptr[rows + 1]
+    positions = np.concatenate([np.arange(s, e) for s, e in zip(starts, ends)])
+    columns, local = np.unique(indices[positions], return_inverse=True)
+    dense = np.zeros((len(rows), len(columns)), dtype=np.float32)
+    dense[np.repeat(np.arange(len(rows)), ends - starts), local] = data[positions]
+    return dense @ dense.T
+
+
+def _assign_canonicals(similar: np.ndarray, tokens: list[frozenset]):
+    # Rows arrive in preference order, each joins the first earlier canonical it is directly similar
+    # to (no transitive chaining) as long as their differing tokens don't change the movement
+    assigned = np.arange(len(similar))
+    is_canonical = np.zeros(len(similar), dtype=bool)
+    for i in range(len(similar)):
+        for j in np.flatnonzero(similar[i, :i] & is_canonical[:i]):
+            if not (tokens[i] ^ tokens[j]) & MOVEMENT_TOKENS:
+                assigned[i] = j
+                break
+        else:
+            is_canonical[i] = True
+    return assigned
+
+
+def build_index(ids: list[int], names: list[str], muscles: list[str], equipment: list[str | None], threshold: float = SIMILARITY_THRESHOLD):
+    ids = np.array(ids, dtype=np.int64)
+    if len(ids) == 0:
+        return ids, ids.copy()
+    normalised = [" ".join(canonical_tokens(name)) for name in names]
+    indptr, indices, data = build_ngram_matrix(normalised)
+
+    # Variants always share muscle and equipment, so only compare names within those blocks
+    blocks = defaultdict(list)
+    for row, key in enumerate(zip(muscles, equipment)):
+        blocks[key].append(row)
+    merged = defaultdict(list)
+    for (muscle, item), rows in blocks.items():
+        merged[(normalise_name(muscle), normalise_name(item or ""))].extend(rows)
+
+    # The plainest name (fewest words, then shortest, then alphabetical) is usually the most conventional variant
+    tokens = [frozenset(name.split()) for name in normalised]
+    token_counts = np.array([len(t) for t in tokens])
+    name_lengths = np.array([len(name) for name in normalised])
+    sort_names = np.array(normalised)
+    canonical_ids = ids.copy()
+    for rows in merged.values():
+        if len(rows) < 2:
+            continue
+        rows = np.array(rows)
+        rows = rows[np.lexsort((ids[rows], sort_names[rows], name_lengths[rows], token_counts[rows]))]
+        similar = _block_similarity(rows, indptr, indices, data) >= threshold
+        assigned = _assign_canonicals(similar, [tokens[r] for r in rows])
+        canonical_ids[rows] = ids[rows[assigned]]
+
+    return ids, canonical_ids
+
+
+def save_index(ids, canonical_ids, path: Path = index_path):
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as file:
+        np.savez(file, ids=ids, canonical_ids=canonical_ids)
+    os.replace(tmp_path, path)
+
+
+class ExerciseIndex:
+    def __init__(self, ids=(), canonical_ids=()):
+        self.canonical = dict(zip(np.asarray(ids).tolist(), np.asarray(canonical_ids).tolist()))
+
+    def canonical_id(self, exercise_id):
+        return self.canonical.get(exercise_id, exercise_id)
+
+    def collapse(self, exercises):
+        return [e for e in exercises if self.canonical_id(e.id) == e.id]
+
+    def dedupe_day(self, day_exercises: list[dict]):
+        seen = set()
+        kept = []
+        for item in day_exercises:
+            if item.get("exercise_id") is None:
+                kept.append(item)
+                continue
+            key = self.canonical_id(item["exercise_id"])
+            if key in seen:
+                continue
+            seen.add(key)
+            kept.append(item)
+        return kept
+
+
+_cached_index = None
+_cached_mtime = None
+
+
+def load_index(path: Path = index_path):
+    global _cached_index, _cached_mtime
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return ExerciseIndex()
+    if _cached_index is None or mtime != _cached_mtime:
+        with np.load(path) as file:
+            _cached_index = ExerciseIndex(file["ids"], file["canonical_ids"])
+        _cached_mtime = mtime
+    return _cached_index
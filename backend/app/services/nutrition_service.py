@@ -0,0 +1,84 @@
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+from backend.app.schemas import Gender, Goal, NutritionTargets
+
+GENDERS = list(Gender)
+GOALS = list(Goal)
+
+# Mifflin-St Jeor sex constant, "other" uses the midpoint of male and female
+BMR_OFFSETS = np.array([5.0, -161.0, -78.0])
+
+# Activity multiplier indexed by weekly training frequency (0-7 days)
+ACTIVITY_FACTORS = np.array([1.2, 1.375, 1.375, 1.55, 1.55, 1.55, 1.725, 1.725])
+
+# Calorie adjustment and protein (g per kg bodyweight) indexed by goal: cut, bulk, maintain
+CALORIE_ADJUSTMENTS = np.array([0.8, 1.1, 1.0])
+PROTEIN_PER_KG = np.array([2.2, 2.0, 1.8])
+
+# Calorie floor indexed by gender, targets never go below this or below BMR
+MIN_CALORIES = np.array([1500.0, 1200.0, 1350.0])
+
+FAT_CALORIE_SHARE = 0.25
+KCAL_PER_G_PROTEIN = 4
+KCAL_PER_G_CARBS = 4
+KCAL_PER_G_FAT = 9
+
+
+def age_on(birth_date: date, today: date):
+    return today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
+
+
+def compute_targets_batch(genders: np.ndarray, ages: np.ndarray, heights_cm: np.ndarray, weights_kg: np.ndarray, goals: np.ndarray, frequencies: np.ndarray):
+    # genders and goals are integer codes, i.e. positions in GENDERS and GOALS
+    bmr = np.maximum(10 * weights_kg + 6.25 * heights_cm - 5 * ages + BMR_OFFSETS[genders], 0)
+    tdee = bmr * ACTIVITY_FACTORS[frequencies]
+    calories = np.maximum(tdee * CALORIE_ADJUSTMENTS[goals], np.maximum(bmr, MIN_CALORIES[genders]))
+
+    # Fat takes a fixed share, protein is capped to what is left and carbs fill the rest, so the macros sum to calories
+    fat_g = calories * FAT_CALORIE_SHARE / KCAL_PER_G_FAT
+    protein_kcal = np.minimum(weights_kg * PROTEIN_PER_KG[goals] * KCAL_PER_G_PROTEIN, calories * (1 - FAT_CALORIE_SHARE))
+    protein_g = protein_kcal / KCAL_PER_G_PROTEIN
+    carbs_g = (calories * (1 - FAT_CALORIE_SHARE) - protein_kcal) / KCAL_PER_G_CARBS
+
+    return {
+        "bmr": bmr,
+        "tdee": tdee,
+        "calories": calories,
+        "protein_g": protein_g,
+        "carbs_g": carbs_g,
+        "fat_g": fat_g,
+    }
+
+
+def profiles_to_arrays(profiles, today: date | None = None):
+    today = today or date.today()
+    return {
+        "genders": np.array([GENDERS.index(Gender(p.gender)) for p in profiles], dtype=np.intp),
+        "ages": np.array([age_on(p.birth_date, today) for p in profiles], dtype=np.float64),
+        "heights_cm": np.array([p.height_cm for p in profiles], dtype=np.float64),
+        "weights_kg": np.array([p.weight_kg for p in profiles], dtype=np.float64),
+        "goals": np.array([GOALS.index(Goal(p.goal)) for p in profiles], dtype=np.intp),
+        "frequencies": np.array([p.frequency for p in profiles], dtype=np.intp),
+    }
+
+
+@lru_cache(maxsize=4096)
+def _cached_targets(gender: Gender, age: int, height_cm: float, weight_kg: float, goal: Goal, frequency: int):
+    # Every input is part of the key, so editing a profile (or a birthday) yields a new cache entry
+    targets = compute_targets_batch(
+        np.array([GENDERS.index(gender)]),
+        np.array([age], dtype=np.float64),
+        np.array([height_cm]),
+        np.array([weight_kg]),
+        np.array([GOALS.index(goal)]),
+        np.array([frequency]),
+    )
+    return NutritionTargets(**{name: round(float(values[0])) for name, values in targets.items()})
+
+
+def compute_targets(profile, today: date | None = None):
+    today = today or date.today()
+    return _cached_targets(Gender(profile.gender), age_on(profile.birth_date, today), profile.height_cm, profile.weight_kg, Goal(profile.goal), profile.frequency)
@@ -0,0 +1,189 @@
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import IO, Iterable, Iterator
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from backend.app.models import User, UserProfile, Equipment, Injury, user_equipment, user_injuries
+from backend.app.services.auth_service import hash_password, find_bodyweight
+from backend.app.schemas import OnboardingCreate, BulkOnboardingError, BulkOnboardingReport
+
+CHUNK_SIZE = 1000
+
+# Bounded so a web worker never forks one process per core for every import request
+HASH_WORKERS = int(os.getenv("ONBOARDING_HASH_WORKERS", min(4, os.cpu_count() or 1)))
+
+USER_FIELDS = ("email", "password")
+ID_LIST_FIELDS = ("injury_ids", "equipment_ids")
+
+
+_hash_pool = None
+
+
+def get_hash_pool():
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ProcessPoolExecutor(max_workers=HASH_WORKERS)
+    return _hash_pool
+
+
+def _safe_hash(password: str):
+    # Runs in the pool, so a password the hasher rejects becomes a row error instead of aborting the import
+    try:
+        return hash_password(password), None
+    except (ValueError, TypeError) as e:
+        return None, f"Invalid password: {e}"
+
+
+def _csv_record(row: dict):
+    # CSV rows are flat, id lists are separated by ";" (e.g. "2;5;7")
+    profile = {k: v for k, v in row.items() if k not in USER_FIELDS and k not in ID_LIST_FIELDS}
+    for field in ID_LIST_FIELDS:
+        value = (row.get(field) or "").strip()
+        profile[field] = [item.strip() for item in value.split(";") if item.strip()]
+    return {"user": {k: row.get(k) for k in USER_FIELDS}, "profile": profile}
+
+
+def read_records(file: IO[str], fmt: str) -> Iterator[tuple[int, dict | None, str | None]]:
+    if fmt == "csv":
+        for row_number, row in enumerate(csv.DictReader(file), start=1):
+            yield row_number, _csv_record(row), None
+    elif fmt == "ndjson":
+        row_number = 0
+        for line in file:
+            if not line.strip():
+                continue
+            row_number += 1
+            try:
+                yield row_number, json.loads(line), None
+            except json.JSONDecodeError as e:
+                yield row_number, None, f"Invalid JSON: {e.msg}"
+    else:
+        raise ValueError(f"Unsupported format: {fmt}")
+
+
+def _validation_detail(error: ValidationError):
+    return "; ".join(f"{'.'.join(str(p) for p in e['loc'])}: {e['msg']}" for e in error.errors())
+
+
+def _email_of(record):
+    if isinstance(record, dict) and isinstance(record.get("user"), dict):
+        email = record["user"].get("email")
+        return email if isinstance(email, str) else None
+    return None
+
+
+def _insert_rows(db: Session, rows, valid_equipment: set[int], valid_injuries: set[int], bodyweight_id: int):
+    user_ids = db.scalars(
+        insert(User).returning(User.id, sort_by_parameter_order=True),
+        [{"email": payload.user.email, "password": password} for _, payload, password in rows],
+    ).all()
+
+    profile_ids = db.scalars(
+        insert(UserProfile).returning(UserProfile.id, sort_by_parameter_order=True),
+        [
+            {"user_id": user_id, **payload.profile.model_dump(exclude={"injury_ids", "equipment_ids"})}
+            for user_id, (_, payload, _) in zip(user_ids, rows)
+        ],
+    ).all()
+
+    equipment_rows = []
+    injury_rows = []
+    for profile_id, (_, payload, _) in zip(profile_ids, rows):
+        equipment_ids = {i for i in payload.profile.equipment_ids if i in valid_equipment} | {bodyweight_id}
+        equipment_rows.extend({"user_profile_id": profile_id, "equipment_id": i} for i in equipment_ids)
+        injury_rows.extend({"user_profile_id": profile_id, "injury_id": i} for i in set(payload.profile.injury_ids) if i in valid_injuries)
+
+    db.execute(insert(user_equipment), equipment_rows)
+    if injury_rows:
+        db.execute(insert(user_injuries), injury_rows)
+    db.commit()
+
+
+def _insert_with_retry(db: Session, rows, valid_equipment: set[int], valid_injuries: set[int], bodyweight_id: int, report: BulkOnboardingReport):
+    # On failure split the rows in halves and retry, so only the offending rows end up reported
+    try:
+        _insert_rows(db, rows, valid_equipment, valid_injuries, bodyweight_id)
+    except SQLAlchemyError as e:
+        db.rollback()
+        if len(rows) == 1:
+            row_number, payload, _ = rows[0]
+            report.errors.append(BulkOnboardingError(row=row_number, email=payload.user.email, detail=f"Failed to insert: {e.__class__.__name__}"))
+            return
+        middle = len(rows) // 2
+        _insert_with_retry(db, rows[:middle], valid_equipment, valid_injuries, bodyweight_id, report)
+        _insert_with_retry(db, rows[middle:], valid_equipment, valid_injuries, bodyweight_id, report)
+        return
+
+    report.created += len(rows)
+
+
+def _import_chunk(db: Session, chunk, pool, valid_equipment: set[int], valid_injuries: set[int], bodyweight_id: int, report: BulkOnboardingReport):
+    validated = []
+    for row_number, record, error in chunk:
+        if error is None:
+            try:
+                validated.append((row_number, OnboardingCreate.model_validate(record)))
+                continue
+            except ValidationError as e:
+                error = _validation_detail(e)
+        report.errors.append(BulkOnboardingError(row=row_number, email=_email_of(record), detail=error))
+
+    emails = [payload.user.email for _, payload in validated]
+    taken = {email for (email,) in db.query(User.email).filter(User.email.in_(emails)).all()} if emails else set()
+
+    # Members registered before this chunk are skipped, so rerunning an import is harmless
+    accepted = []
+    seen = set()
+    for row_number, payload in validated:
+        email = payload.user.email
+        if email in taken:
+            report.skipped += 1
+            continue
+        if email in seen:
+            report.errors.append(BulkOnboardingError(row=row_number, email=email, detail="Duplicate email in import"))
+            continue
+        seen.add(email)
+        accepted.append((row_number, payload))
+
+    if not accepted:
+        return
+
+    rows = []
+    hashed = pool.map(_safe_hash, [payload.user.password for _, payload in accepted], chunksize=16)
+    for (row_number, payload), (password, error) in zip(accepted, hashed):
+        if error:
+            report.errors.append(BulkOnboardingError(row=row_number, email=payload.user.email, detail=error))
+            continue
+        rows.append((row_number, payload, password))
+
+    if rows:
+        _insert_with_retry(db, rows, valid_equipment, valid_injuries, bodyweight_id, report)
+
+
+def import_members(db: Session, records: Iterable[tuple[int, dict | None, str | None]], chunk_size: int = CHUNK_SIZE, start_row: int = 1):
+    report = BulkOnboardingReport(created=0, skipped=0, failed=0, next_row=start_row, errors=[])
+
+    bodyweight = find_bodyweight(db)
+    if not bodyweight:
+        raise LookupError("Bodyweight missing from equipment table")
+    bodyweight_id = bodyweight.id
+    valid_equipment = {i for (i,) in db.query(Equipment.id).all()}
+    valid_injuries = {i for (i,) in db.query(Injury.id).all()}
+
+    # Each chunk is committed on its own, so a failed run can be resumed from report.next_row
+    records = (r for r in records if r[0] >= start_row)
+    pool = get_hash_pool()
+    while chunk := list(islice(records, chunk_size)):
+        _import_chunk(db, chunk, pool, valid_equipment, valid_injuries, bodyweight_id, report)
+        report.next_row = chunk[-1][0] + 1
+
+    report.errors.sort(key=lambda e: e.row)
+    report.failed = len(report.errors)
+    return report
@@ -2,6 +2,8 @@ import json
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from backend.app.services.plan_generator import generate_workout_plan, build_prompt
+from backend.app.services.exercise_index import load_index
+from backend.app.services.catalog_snapshot import load_snapshot
 from backend.app.models import Exercise, UserProfile, Workout
 from datetime import date, timedelta
 
@@ -10,13 +12,15 @@ def get_user_data(db: Session, user_id: int):
     if not profile:
         raise Exception("Profile not found")
     
-    exercises = db.query(Exercise).all()
+    catalog = load_snapshot(db)
+    exercises = catalog.exercises() if catalog else db.query(Exercise).all()
     return profile, exercises
 
 
 def generate_and_store_plan(db: Session, user):
     profile, exercises = get_user_data(db, user.id)
-    prompt = build_prompt(profile, exercises)
+    index = load_index()
+    prompt = build_prompt(profile, index.collapse(exercises))
 
     try:
         ai_response = generate_workout_plan(prompt)
@@ -29,6 +33,7 @@ def generate_and_store_plan(db: Session, user):
 
         for week in plan["weeks"]:
             for day in week["days"]:
+                day["exercises"] = index.dedupe_day(day.get("exercises", []))
                 date_offset = day.get("date_offset", 0)
                 workout_date = today + timedelta(days=date_offset)
                 db.add(Workout(user_id=user.id, date=workout_date, exercise_list=day))
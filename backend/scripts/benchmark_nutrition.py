@@ -0,0 +1,37 @@
+import argparse
+import time
+
+import numpy as np
+
+from backend.app.services.nutrition_service import compute_targets_batch, GENDERS, GOALS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time batch nutrition target recomputation over synthetic profiles")
+    parser.add_argument("--profiles", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    n = args.profiles
+    cohort = {
+        "genders": rng.integers(0, len(GENDERS), n),
+        "ages": rng.integers(13, 101, n).astype(np.float64),
+        "heights_cm": rng.uniform(150, 200, n),
+        "weights_kg": rng.uniform(45, 140, n),
+        "goals": rng.integers(0, len(GOALS), n),
+        "frequencies": rng.integers(1, 8, n),
+    }
+
+    timings = []
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        compute_targets_batch(**cohort)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    print(f"{n} profiles: best {best * 1000:.1f} ms, median {np.median(timings) * 1000:.1f} ms ({n / best / 1e6:.1f}M profiles/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+from pathlib import Path
+import pandas as pd
+
+from backend.app.services.exercise_index import build_index
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+data_path = BASE_DIR / "data" / "gym_exercises.xlsx"
+
+# Variants that should collapse into the name on the right
+MERGED = [
+    ("Barbell Full Squat", "Barbell Squat"),
+    ("Alternating incline dumbbell biceps curl", "Alternate Incline Dumbbell Curl"),
+    ("Straight-arm rope pull-down", "Straight-Arm Pulldown"),
+    ("Seated dumbbell shoulder press", "Seated Dumbbell Press"),
+]
+
+# Names that differ in the movement itself and must stay separate
+SEPARATE = [
+    ("Incline dumbbell bench press", "Dumbbell Bench Press"),
+    ("Decline dumbbell bench press", "Dumbbell Bench Press"),
+    ("Reverse-grip incline dumbbell bench press", "Dumbbell Bench Press"),
+    ("Incline Dumbbell Flyes", "Decline Dumbbell Flyes"),
+    ("Wide-grip barbell curl", "Close-grip barbell curl"),
+    ("Palms-up wrist curl over bench", "Palms-down wrist curl over bench"),
+    ("Lying Face Up Plate Neck Resistance", "Lying Face Down Plate Neck Resistance"),
+    ("Kneeling cable triceps extension", "Lying cable triceps extension"),
+    ("Incline cable chest fly", "Cable Chest Press"),
+]
+
+
+def main():
+    df = pd.read_excel(data_path)
+    df["Exercise_Name"] = df["Exercise_Name"].str.strip()
+    df["muscle_gp"] = df["muscle_gp"].str.strip()
+    df["Equipment"] = df["Equipment"].str.strip()
+
+    ids = list(range(1, len(df) + 1))
+    ids, canonical_ids = build_index(ids, df["Exercise_Name"].tolist(), df["muscle_gp"].tolist(), df["Equipment"].tolist())
+    canonical = {name: c for name, c in zip(df["Exercise_Name"], canonical_ids.tolist())}
+    names = dict(zip(ids.tolist(), df["Exercise_Name"]))
+
+    failures = []
+    for variant, expected in MERGED:
+        if names[canonical[variant]] != expected:
+            failures.append(f"{variant!r} should merge into {expected!r}, got {names[canonical[variant]]!r}")
+    for a, b in SEPARATE:
+        if canonical[a] == canonical[b]:
+            failures.append(f"{a!r} and {b!r} should stay separate, both map to {names[canonical[a]]!r}")
+
+    if failures:
+        raise SystemExit("\n".join(failures))
+    print(f"{len(MERGED) + len(SEPARATE)} checks passed, {len(set(canonical_ids.tolist()))} canonical exercises out of {len(ids)}")
+
+
+if __name__ == "__main__":
+    main()
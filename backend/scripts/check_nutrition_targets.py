@@ -0,0 +1,50 @@
+from datetime import date
+from itertools import product
+from types import SimpleNamespace
+
+import numpy as np
+
+from backend.app.schemas import Gender, Goal
+from backend.app.services.nutrition_service import (
+    compute_targets, compute_targets_batch, GENDERS, GOALS, MIN_CALORIES,
+    KCAL_PER_G_PROTEIN, KCAL_PER_G_CARBS, KCAL_PER_G_FAT,
+)
+
+# The extreme bounds UserProfileBase accepts
+HEIGHTS_CM = [50, 250]
+WEIGHTS_KG = [20, 500]
+AGES = [13, 100]
+FREQUENCIES = [1, 7]
+
+
+def main():
+    grid = np.array(list(product(range(len(GENDERS)), AGES, HEIGHTS_CM, WEIGHTS_KG, range(len(GOALS)), FREQUENCIES)), dtype=np.float64)
+    genders, ages, heights, weights, goals, frequencies = grid.T
+    genders, goals, frequencies = genders.astype(np.intp), goals.astype(np.intp), frequencies.astype(np.intp)
+    targets = compute_targets_batch(genders, ages, heights, weights, goals, frequencies)
+
+    failures = []
+    for name, values in targets.items():
+        if (values < 0).any():
+            failures.append(f"{name} is negative for {int((values < 0).sum())} profiles")
+    floor = np.maximum(targets["bmr"], MIN_CALORIES[genders])
+    if (targets["calories"] < floor - 1e-6).any():
+        failures.append("calories fall below the BMR / minimum calorie floor")
+    macro_kcal = targets["protein_g"] * KCAL_PER_G_PROTEIN + targets["carbs_g"] * KCAL_PER_G_CARBS + targets["fat_g"] * KCAL_PER_G_FAT
+    if not np.allclose(macro_kcal, targets["calories"]):
+        failures.append(f"macros do not add up to calories (max gap {np.abs(macro_kcal - targets['calories']).max():.1f} kcal)")
+
+    # The profile from the review: 99-year-old female, 50 cm / 20 kg, on a cut
+    today = date(2026, 1, 1)
+    profile = SimpleNamespace(gender=Gender.female, birth_date=date(1926, 6, 1), height_cm=50, weight_kg=20, goal=Goal.cut, frequency=1)
+    single = compute_targets(profile, today)
+    if single.bmr < 0 or single.calories < MIN_CALORIES[GENDERS.index(Gender.female)]:
+        failures.append(f"single profile targets are unsafe: {single}")
+
+    if failures:
+        raise SystemExit("\n".join(failures))
+    print(f"{len(grid)} boundary profiles checked, extreme cut profile -> {single}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import argparse
+from pathlib import Path
+
+from backend.app.database import SessionLocal
+from backend.app.services.onboarding_service import read_records, import_members, CHUNK_SIZE
+
+
+def positive_int(value: str):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk onboard members from a CSV or NDJSON file")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=["csv", "ndjson"])
+    parser.add_argument("--chunk-size", type=positive_int, default=CHUNK_SIZE)
+    parser.add_argument("--start-row", type=positive_int, default=1, help="Resume from this data row (see next_row in the report)")
+    args = parser.parse_args()
+
+    fmt = args.format or ("ndjson" if args.path.suffix in (".ndjson", ".jsonl") else "csv")
+
+    db = SessionLocal()
+    try:
+        with open(args.path, newline="", encoding="utf-8-sig") as file:
+            report = import_members(db, read_records(file, fmt), chunk_size=args.chunk_size, start_row=args.start_row)
+    except LookupError as e:
+        raise SystemExit(str(e))
+    finally:
+        db.close()
+
+    print(report.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    main()
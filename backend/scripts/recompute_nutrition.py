@@ -0,0 +1,51 @@
+import argparse
+import csv
+import sys
+from itertools import islice
+from pathlib import Path
+
+from backend.app.database import SessionLocal
+from backend.app.models import UserProfile
+from backend.app.services.nutrition_service import compute_targets_batch, profiles_to_arrays
+
+BATCH_SIZE = 100_000
+
+TARGET_FIELDS = ["bmr", "tdee", "calories", "protein_g", "carbs_g", "fat_g"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute nutrition targets for every user profile and write them as CSV")
+    parser.add_argument("--output", type=Path, help="CSV file to write (defaults to stdout)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+
+    db = SessionLocal()
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        # Only the columns the engine needs, streamed so large cohorts never sit in memory as ORM objects
+        rows = iter(db.query(
+            UserProfile.user_id,
+            UserProfile.gender,
+            UserProfile.birth_date,
+            UserProfile.height_cm,
+            UserProfile.weight_kg,
+            UserProfile.goal,
+            UserProfile.frequency,
+        ).yield_per(args.batch_size))
+
+        writer = csv.writer(output)
+        writer.writerow(["user_id"] + TARGET_FIELDS)
+        while batch := list(islice(rows, args.batch_size)):
+            targets = compute_targets_batch(**profiles_to_arrays(batch))
+            columns = [targets[name].round().astype(int).tolist() for name in TARGET_FIELDS]
+            writer.writerows(zip([p.user_id for p in batch], *columns))
+    finally:
+        if args.output:
+            output.close()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
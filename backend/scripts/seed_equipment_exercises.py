@@ -3,6 +3,8 @@ import pandas as pd
 
 from backend.app.database import SessionLocal, engine, Base
 from backend.app.models import Equipment, Exercise
+from backend.app.services.exercise_index import build_index, save_index
+from backend.app.services.catalog_snapshot import write_snapshot
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 data_path = BASE_DIR / "data" / "gym_exercises.xlsx"
@@ -44,5 +46,15 @@ try:
     db.bulk_save_objects(exercises)
     db.commit()
 
+    rows = db.query(Exercise.id, Exercise.name, Exercise.target_muscle, Equipment.name).outerjoin(Equipment, Exercise.equipment_id == Equipment.id).all()
+    ids, canonical_ids = build_index(
+        [r[0] for r in rows],
+        [r[1] for r in rows],
+        [r[2] for r in rows],
+        [r[3] for r in rows],
+    )
+    save_index(ids, canonical_ids)
+    write_snapshot(db)
+
 finally:
     db.close()
\ No newline at end of file
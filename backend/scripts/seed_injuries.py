@@ -3,6 +3,7 @@ import json
 
 from backend.app.database import SessionLocal, engine, Base
 from backend.app.models import Injury
+from backend.app.services.catalog_snapshot import write_snapshot
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 data_path = BASE_DIR / "data" / "injuries.json"
@@ -19,6 +20,7 @@ try:
     injuries = [Injury(name=item["name"]) for item in injuries_data]
     db.bulk_save_objects(injuries)
     db.commit()
+    write_snapshot(db)
 
 finally:
     db.close()
\ No newline at end of file